@@ -1,12 +1,33 @@
+import itertools
+import operator
+import sys
 from collections import deque
 
+# Table separators
+SEP85 = "-" * 85
+SEP90 = "-" * 90
+SEP95 = "-" * 95
+
+# Row templates, parsed once and reused for every table row
+DELIVERY_ROW = "{:<10} {:<15} {:<15} {:<15} {:<10}".format
+DELIVERY_ROW_WIDE = "{:<10} {:<15} {:<15} {:<15} {:<15}".format
+ROUTE_ROW = "{:<10} {:<15} {:<15} {:<30} {:<10}".format
+
+# Delivery statuses
+PENDING = "Pending"
+DISPATCHED = "Dispatched"
+OUT_FOR_DELIVERY = "Out for Delivery"
+DELIVERED = "Delivered"
+
 # ============================================
 # DELIVERY CLASS (Core Data Module)
 # ============================================
 class Delivery:
     """Represents a single delivery record"""
     
-    def __init__(self, parcel_id, sender, receiver, destination, status="Pending"):
+    __slots__ = ("id", "sender", "receiver", "destination", "status")
+    
+    def __init__(self, parcel_id, sender, receiver, destination, status=PENDING):
         self.id = parcel_id
         self.sender = sender
         self.receiver = receiver
@@ -36,53 +57,65 @@ class DeliveryManager:
     
     def __init__(self):
         self.deliveries = []
+        self._by_id = {}
         self.completed_deliveries = []
         self.status_options = {
-            "1": "Pending",
-            "2": "Dispatched",
-            "3": "Out for Delivery",
-            "4": "Delivered"
+            "1": PENDING,
+            "2": DISPATCHED,
+            "3": OUT_FOR_DELIVERY,
+            "4": DELIVERED
         }
+        self.status_order = {status: i for i, status in enumerate(self.status_options.values())}
+        self._by_status = {status: [] for status in self.status_options.values()}
     
     def add_delivery(self, delivery):
         """Add a new delivery to the system"""
         self.deliveries.append(delivery)
+        self._by_id[delivery.id] = delivery
+        self._by_status.setdefault(delivery.status, []).append(delivery)
+    
+    def set_status(self, delivery, new_status):
+        """Update a delivery's status and move it to the matching status bucket"""
+        self._by_status[delivery.status].remove(delivery)
+        delivery.update_status(new_status)
+        self._by_status.setdefault(new_status, []).append(delivery)
     
     def find_by_id(self, parcel_id):
         """Find a delivery by ID"""
-        for delivery in self.deliveries:
-            if delivery.id == parcel_id:
-                return delivery
-        return None
+        return self._by_id.get(parcel_id)
     
     def id_exists(self, parcel_id):
         """Check if a parcel ID already exists"""
-        return any(d.id == parcel_id for d in self.deliveries)
+        return parcel_id in self._by_id
     
     def get_active_delivery(self):
         """Get the currently active (non-pending, non-delivered) delivery"""
-        for delivery in self.deliveries:
-            if delivery.status in ["Dispatched", "Out for Delivery"]:
-                return delivery
+        for status in (DISPATCHED, OUT_FOR_DELIVERY):
+            if self._by_status[status]:
+                return self._by_status[status][0]
         return None
     
     def get_active_deliveries(self):
-        """Get all active or pending deliveries"""
-        return [d for d in self.deliveries if d.status != "Delivered"]
+        """Get all active or pending deliveries, in-progress ones first"""
+        active = (self._by_status[DISPATCHED]
+                  + self._by_status[OUT_FOR_DELIVERY]
+                  + self._by_status[PENDING])
+        for status, bucket in self._by_status.items():
+            if status not in self.status_order:
+                active += bucket
+        return active
     
     def get_delivered(self):
         """Get all delivered items"""
-        return [d for d in self.deliveries if d.status == "Delivered"]
+        return self.filter_by_status(DELIVERED)
     
     def filter_by_status(self, status):
         """Filter deliveries by status"""
-        return [d for d in self.deliveries if d.status == status]
+        return list(self._by_status.get(status, []))
     
     def complete_delivery(self, delivery, route_graph):
         """Mark delivery as completed and record route info"""
-        route = route_graph.find_route(delivery.destination)
-        route_str = " -> ".join(route) if route else "N/A"
-        travel_time = route_graph.calculate_travel_time(route) if route else 0
+        route_str, travel_time = route_graph.route_info(delivery.destination)
         
         completed_record = {
             "id": delivery.id,
@@ -92,7 +125,7 @@ class DeliveryManager:
             "destination": delivery.destination,
             "route": route_str,
             "time": travel_time,
-            "status": "Delivered"
+            "status": DELIVERED
         }
         self.completed_deliveries.append(completed_record)
 
@@ -104,17 +137,28 @@ class Scheduler:
     """Manages delivery scheduling queue"""
     
     def __init__(self):
-        self.schedule_queue = deque()
+        self._queue = deque()
+        self._tickets = itertools.count()
+        self._latest_ticket = {}
     
     def add_to_queue(self, delivery):
-        """Add a delivery to the scheduling queue"""
-        self.schedule_queue.append(delivery)
+        """Add a pending delivery to the back of the scheduling queue"""
+        if delivery.status == PENDING:
+            # A newer ticket supersedes any entry already queued for this delivery
+            ticket = next(self._tickets)
+            self._latest_ticket[delivery] = ticket
+            self._queue.append((ticket, delivery))
     
-    def dispatch_next_pending(self):
+    def dispatch_next_pending(self, delivery_manager):
         """Automatically dispatch the next pending delivery in queue"""
-        for delivery in self.schedule_queue:
-            if delivery.status == "Pending":
-                delivery.update_status("Dispatched")
+        while self._queue:
+            ticket, delivery = self._queue.popleft()
+            # Skip superseded duplicates and entries whose status changed outside the queue
+            if self._latest_ticket.get(delivery) != ticket:
+                continue
+            del self._latest_ticket[delivery]
+            if delivery.status == PENDING:
+                delivery_manager.set_status(delivery, DISPATCHED)
                 return delivery
         return None
 
@@ -126,17 +170,17 @@ class RouteGraph:
     """Manages delivery routes and travel times"""
     
     def __init__(self):
-        self.routes = {
-            "Warehouse": ["Area A", "Area B"],
-            "Area A": ["Area C", "Area D"],
-            "Area B": ["Area E", "Area F"],
-            "Area C": [],
-            "Area D": [],
-            "Area E": [],
-            "Area F": []
+        routes = {
+            "Warehouse": ("Area A", "Area B"),
+            "Area A": ("Area C", "Area D"),
+            "Area B": ("Area E", "Area F"),
+            "Area C": (),
+            "Area D": (),
+            "Area E": (),
+            "Area F": ()
         }
         
-        self.travel_times = {
+        travel_times = {
             ("Warehouse", "Area A"): 3,
             ("Warehouse", "Area B"): 4,
             ("Area A", "Area C"): 3,
@@ -144,36 +188,56 @@ class RouteGraph:
             ("Area B", "Area E"): 4,
             ("Area B", "Area F"): 4
         }
+        
+        # Tuples for neighbours and interned area names keep the static graph compact
+        self.routes = {
+            sys.intern(place): tuple(sys.intern(child) for child in children)
+            for place, children in routes.items()
+        }
+        self.travel_times = {
+            (sys.intern(src), sys.intern(dst)): minutes
+            for (src, dst), minutes in travel_times.items()
+        }
+        
+        # The graph is static, so every route is computed once up front
+        self._paths = {}
+        self._route_info = {}
+        self._precompute_routes()
     
-    def find_route(self, destination):
-        """BFS to find route from Warehouse to destination"""
-        queue = deque([("Warehouse", ["Warehouse"])])
-        visited = set()
+    def _precompute_routes(self):
+        """Single BFS from Warehouse caching the route and its summary for every area"""
+        parent = {"Warehouse": None}
+        queue = deque(["Warehouse"])
         
         while queue:
-            current, path = queue.popleft()
-            
-            if current == destination:
-                return path
-            
-            if current in visited:
-                continue
-            
-            visited.add(current)
-            
+            current = queue.popleft()
             for child in self.routes.get(current, []):
-                if child not in visited:
-                    queue.append((child, path + [child]))
-        
-        return []
+                if child not in parent:
+                    parent[child] = current
+                    queue.append(child)
+        
+        for destination in parent:
+            path = []
+            node = destination
+            while node is not None:
+                path.append(node)
+                node = parent[node]
+            path.reverse()
+            self._paths[destination] = tuple(path)
+            self._route_info[destination] = (" -> ".join(path), self.calculate_travel_time(path))
+    
+    def find_route(self, destination):
+        """Return a copy of the cached BFS route from Warehouse to destination"""
+        return list(self._paths.get(destination, ()))
+    
+    def route_info(self, destination):
+        """Return the cached (route string, travel time) pair for a destination"""
+        return self._route_info.get(destination, ("N/A", 0))
     
     def calculate_travel_time(self, route):
         """Calculate total travel time for a route"""
-        total_time = 0
-        for i in range(len(route) - 1):
-            edge = (route[i], route[i+1])
-            total_time += self.travel_times.get(edge, 0)
-        return total_time
+        get = self.travel_times.get
+        return sum(get((a, b), 0) for a, b in zip(route, route[1:]))
     
     def get_route_map(self):
         """Return the route map"""
@@ -188,34 +252,23 @@ class SortingModule:
     
     @staticmethod
     def quick_sort(arr, key):
-        """Quick sort algorithm for sorting by a specific key"""
+        """Sort deliveries by a specific key using the built-in Timsort"""
         if len(arr) <= 1:
             return arr
         
-        pivot = arr[0]
-        pivot_val = getattr(pivot, key) if hasattr(pivot, key) else pivot.get(key)
-        
-        if pivot_val is None:
-            return arr
-        
-        left = [x for x in arr if (getattr(x, key) if hasattr(x, key) else x.get(key)) < pivot_val]
-        middle = [x for x in arr if (getattr(x, key) if hasattr(x, key) else x.get(key)) == pivot_val]
-        right = [x for x in arr if (getattr(x, key) if hasattr(x, key) else x.get(key)) > pivot_val]
-        
-        return SortingModule.quick_sort(left, key) + middle + SortingModule.quick_sort(right, key)
+        return sorted(arr, key=operator.attrgetter(key))
     
     @staticmethod
-    def group_sort(arr, primary_key, secondary_key, status_options):
+    def group_sort(arr, primary_key, secondary_key, status_order):
         """Sorts deliveries first by primary key, then by secondary key"""
         groups = {}
         for item in arr:
-            key = getattr(item, primary_key) if hasattr(item, primary_key) else item.get(primary_key)
+            key = getattr(item, primary_key)
             if key not in groups:
                 groups[key] = []
             groups[key].append(item)
         
         final_sorted_list = []
-        status_order = {status: i for i, status in enumerate(status_options.values())}
         sorted_groups_keys = sorted(groups.keys(), key=lambda k: status_order.get(k, 99))
         
         for key in sorted_groups_keys:
@@ -253,10 +306,10 @@ class UserInterface:
         active_delivery = self.delivery_manager.get_active_delivery()
         
         if active_delivery is None:
-            status = "Dispatched"
+            status = DISPATCHED
             print(f"No active delivery found. Parcel {parcel_id} is now DISPATCHED!")
         else:
-            status = "Pending"
+            status = PENDING
             print(f"Delivery in progress (ID: {active_delivery.id}). Parcel {parcel_id} added to queue as PENDING.")
         
         delivery = Delivery(parcel_id, sender, receiver, destination, status)
@@ -275,8 +328,8 @@ class UserInterface:
             return
         
         print("\nActive Deliveries:")
-        for d in active_deliveries:
-            print(f"ID: {d.id} - Status: {d.status}")
+        rows = [f"ID: {d.id} - Status: {d.status}" for d in active_deliveries]
+        sys.stdout.write("\n".join(rows) + "\n")
         
         parcel_id = input("\nEnter Parcel ID to update: ")
         delivery = self.delivery_manager.find_by_id(parcel_id)
@@ -297,10 +350,13 @@ class UserInterface:
         if choice in self.delivery_manager.status_options:
             old_status = delivery.status
             new_status = self.delivery_manager.status_options[choice]
-            delivery.update_status(new_status)
+            self.delivery_manager.set_status(delivery, new_status)
             print(f"Status Updated to: {new_status}!")
             
-            if new_status == "Delivered" and old_status in ["Dispatched", "Out for Delivery"]:
+            if new_status == PENDING and old_status != PENDING:
+                self.scheduler.add_to_queue(delivery)
+            
+            if new_status == DELIVERED and old_status in (DISPATCHED, OUT_FOR_DELIVERY):
                 self.delivery_manager.complete_delivery(delivery, self.route_graph)
                 self.show_status_report()
                 self.dispatch_next_pending()
@@ -309,7 +365,7 @@ class UserInterface:
     
     def dispatch_next_pending(self):
         """Automatically dispatch the next pending delivery"""
-        next_delivery = self.scheduler.dispatch_next_pending()
+        next_delivery = self.scheduler.dispatch_next_pending(self.delivery_manager)
         if next_delivery:
             print(f"\n>>> Next delivery auto-dispatched: ID {next_delivery.id} to {next_delivery.destination}")
         else:
@@ -324,14 +380,10 @@ class UserInterface:
             return
         
         print("\n--- Status Report: Delivered Today ---")
-        print("-" * 85)
-        print(f"{'ID':<10} {'Sender':<15} {'Receiver':<15} {'Destination':<15} {'Status':<10}")
-        print("-" * 85)
-        
-        for d in delivered:
-            print(f"{d.id:<10} {d.sender:<15} {d.receiver:<15} {d.destination:<15} {d.status:<10}")
-        
-        print("-" * 85)
+        rows = [SEP85, DELIVERY_ROW("ID", "Sender", "Receiver", "Destination", "Status"), SEP85]
+        rows += [DELIVERY_ROW(d.id, d.sender, d.receiver, d.destination, d.status) for d in delivered]
+        rows.append(SEP85)
+        sys.stdout.write("\n".join(rows) + "\n")
     
     def view_status_report(self):
         """View deliveries filtered by status with sorting"""
@@ -368,14 +420,10 @@ class UserInterface:
             sorted_deliveries = SortingModule.quick_sort(filtered, key="destination")
             
             print(f"\n--- {filter_name} (Sorted by Destination) ---")
-            print("-" * 95)
-            print(f"{'ID':<10} {'Sender':<15} {'Receiver':<15} {'Destination':<15} {'Status':<15}")
-            print("-" * 95)
-            
-            for d in sorted_deliveries:
-                print(f"{d.id:<10} {d.sender:<15} {d.receiver:<15} {d.destination:<15} {d.status:<15}")
-            
-            print("-" * 95)
+            rows = [SEP95, DELIVERY_ROW_WIDE("ID", "Sender", "Receiver", "Destination", "Status"), SEP95]
+            rows += [DELIVERY_ROW_WIDE(d.id, d.sender, d.receiver, d.destination, d.status) for d in sorted_deliveries]
+            rows.append(SEP95)
+            sys.stdout.write("\n".join(rows) + "\n")
             print(f"Total: {len(sorted_deliveries)} deliveries")
     
     def sort_deliveries(self):
@@ -383,15 +431,17 @@ class UserInterface:
         print("\n--- Sort Deliveries by Destination ---")
         sorted_list = SortingModule.quick_sort(self.delivery_manager.deliveries, key="destination")
         
-        for d in sorted_list:
-            print(f"{d.id} - {d.destination} - {d.status}")
+        rows = [f"{d.id} - {d.destination} - {d.status}" for d in sorted_list]
+        if rows:
+            sys.stdout.write("\n".join(rows) + "\n")
     
     def show_map(self):
         """Display route map and completed deliveries"""
         print("\n--- Route Map (Graph) ---")
         route_map = self.route_graph.get_route_map()
-        for place, connected in route_map.items():
-            print(f"{place} -> {', '.join(connected) if connected else 'No outgoing routes'}")
+        rows = [f"{place} -> {', '.join(connected) if connected else 'No outgoing routes'}"
+                for place, connected in route_map.items()]
+        sys.stdout.write("\n".join(rows) + "\n")
         
         if not self.delivery_manager.completed_deliveries:
             print("\n--- Route Summary Table ---")
@@ -399,17 +449,21 @@ class UserInterface:
             return
         
         print("\n--- Route Summary Table (Completed Deliveries Only) ---")
-        print("-" * 90)
-        print(f"{'ID':<10} {'Origin':<15} {'Destination':<15} {'Route':<30} {'Time (min)':<10}")
-        print("-" * 90)
-        
-        for delivery in self.delivery_manager.completed_deliveries:
-            print(f"{delivery['id']:<10} {delivery['origin']:<15} {delivery['destination']:<15} {delivery['route']:<30} {delivery['time']:<10}")
-        
-        print("-" * 90)
+        rows = [SEP90, ROUTE_ROW("ID", "Origin", "Destination", "Route", "Time (min)"), SEP90]
+        rows += [ROUTE_ROW(delivery["id"], delivery["origin"], delivery["destination"], delivery["route"], delivery["time"]) for delivery in self.delivery_manager.completed_deliveries]
+        rows.append(SEP90)
+        sys.stdout.write("\n".join(rows) + "\n")
     
     def main_menu(self):
         """Display and handle main menu"""
+        actions = {
+            "1": self.register_delivery,
+            "2": self.update_status,
+            "3": self.view_status_report,
+            "4": self.sort_deliveries,
+            "5": self.show_map,
+        }
+        
         while True:
             print("\n" + "="*30)
             print(" LOGISTIC DELIVERY SYSTEM ")
@@ -423,19 +477,13 @@ class UserInterface:
             
             choice = input("Enter choice: ")
             
-            if choice == "1":
-                self.register_delivery()
-            elif choice == "2":
-                self.update_status()
-            elif choice == "3":
-                self.view_status_report()
-            elif choice == "4":
-                self.sort_deliveries()
-            elif choice == "5":
-                self.show_map()
-            elif choice == "6":
+            if choice == "6":
                 print("Exiting system...")
                 break
+            
+            action = actions.get(choice)
+            if action:
+                action()
             else:
                 print("Invalid choice. Try again.")
 